@@ -1,11 +1,15 @@
 package com.codeturret.api;
 
 import com.codeturret.api.dto.AskRequest;
-import com.codeturret.repository.FindingRepo;
+import com.codeturret.model.Scan;
+import com.codeturret.model.ScanStatus;
+import com.codeturret.repository.ScanRepo;
 import com.codeturret.service.CortexService;
 import jakarta.validation.Valid;
 import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpStatus;
 import org.springframework.web.bind.annotation.*;
+import org.springframework.web.server.ResponseStatusException;
 
 import java.util.Map;
 import java.util.UUID;
@@ -15,13 +19,23 @@ import java.util.UUID;
 @RequiredArgsConstructor
 public class AskController {
 
-    private final FindingRepo findingRepo;
+    private final ScanRepo scanRepo;
     private final CortexService cortexService;
 
     @PostMapping
     public Map<String, String> ask(@Valid @RequestBody AskRequest request) {
-        var findings = findingRepo.findByScan_Id(UUID.fromString(request.getScanId()));
-        String answer = cortexService.askAboutFindings(findings, request.getQuestion());
+        UUID scanId = UUID.fromString(request.getScanId());
+        Scan scan = scanRepo.findById(scanId)
+            .orElseThrow(() -> new ResponseStatusException(HttpStatus.NOT_FOUND, "Scan not found"));
+
+        if (scan.getStatus() == ScanStatus.FAILED) {
+            throw new ResponseStatusException(HttpStatus.CONFLICT, "Scan failed");
+        }
+        if (scan.getStatus() != ScanStatus.COMPLETED) {
+            throw new ResponseStatusException(HttpStatus.CONFLICT, "Scan is not completed yet");
+        }
+
+        String answer = cortexService.askAboutScan(scan, request.getQuestion());
         return Map.of("answer", answer);
     }
 }
@@ -1,9 +1,12 @@
 package com.codeturret.config;
 
+import jakarta.validation.constraints.Min;
 import lombok.Data;
 import org.springframework.boot.context.properties.ConfigurationProperties;
+import org.springframework.validation.annotation.Validated;
 
 @ConfigurationProperties(prefix = "snowflake")
+@Validated
 @Data
 public class SnowflakeProperties {
     private String account;
@@ -13,6 +16,8 @@ public class SnowflakeProperties {
     private String database = "CODEBOUNCER";
     private String schema = "CORE";
     private String cortexModel = "llama3.1-8b";
+    @Min(1)
+    private int chatPromptMaxFindings = 50;
 
     public boolean isConfigured() {
         return account != null && !account.isBlank()
@@ -2,6 +2,7 @@ package com.codeturret.repository;
 
 import com.codeturret.model.Finding;
 import com.codeturret.model.Severity;
+import org.springframework.data.domain.Pageable;
 import org.springframework.data.jpa.repository.JpaRepository;
 import org.springframework.data.jpa.repository.Query;
 
@@ -24,7 +25,21 @@ public interface FindingRepo extends JpaRepository<Finding, UUID> {
         """)
     List<Finding> findByScanIdOrdered(UUID scanId);
 
-    List<Finding> findByScan_Id(UUID scanId);
+    @Query("""
+        SELECT new com.codeturret.repository.FindingSummary(
+          f.severity, f.vulnType, f.filePath, f.lineNumber, f.description, f.commitAuthor)
+        FROM Finding f
+        WHERE f.scan.id = :scanId
+        ORDER BY
+          CASE f.severity
+            WHEN com.codeturret.model.Severity.CRITICAL THEN 1
+            WHEN com.codeturret.model.Severity.HIGH     THEN 2
+            WHEN com.codeturret.model.Severity.MEDIUM   THEN 3
+            ELSE 4
+          END,
+          f.confidence DESC NULLS LAST
+        """)
+    List<FindingSummary> findTopSummariesByScanId(UUID scanId, Pageable pageable);
 
     @Query("SELECT f FROM Finding f WHERE f.scan.id = :scanId AND f.fixSuggestion IS NOT NULL AND f.fixSuggestion != ''")
     List<Finding> findFixableByScanId(UUID scanId);
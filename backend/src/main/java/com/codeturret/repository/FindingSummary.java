@@ -0,0 +1,9 @@
+package com.codeturret.repository;
+
+import com.codeturret.model.Severity;
+
+/** Columns the Q&A prompt needs, without loading the full entity. */
+public record FindingSummary(
+    Severity severity, String vulnType, String filePath, Integer lineNumber,
+    String description, String commitAuthor
+) {}
@@ -1,19 +1,29 @@
 package com.codeturret.service;
 
 import com.codeturret.config.SnowflakeProperties;
-import com.codeturret.model.Finding;
+import com.codeturret.model.Scan;
+import com.codeturret.repository.FindingRepo;
+import com.codeturret.repository.FindingSummary;
 import com.fasterxml.jackson.databind.JsonNode;
 import com.fasterxml.jackson.databind.ObjectMapper;
+import com.zaxxer.hikari.HikariConfig;
+import com.zaxxer.hikari.HikariDataSource;
+import jakarta.annotation.PreDestroy;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
+import org.springframework.data.domain.PageRequest;
 import org.springframework.stereotype.Service;
 
 import java.sql.Connection;
-import java.sql.DriverManager;
 import java.sql.PreparedStatement;
 import java.sql.ResultSet;
+import java.sql.SQLException;
+import java.time.Duration;
+import java.util.Collections;
+import java.util.LinkedHashMap;
 import java.util.List;
-import java.util.Properties;
+import java.util.Map;
+import java.util.UUID;
 
 /**
  * Calls Snowflake Cortex COMPLETE for natural-language Q&A over scan findings.
@@ -24,19 +34,48 @@ import java.util.Properties;
 @Slf4j
 public class CortexService {
 
+    private static final int ANSWER_CACHE_CAPACITY = 1024;
+    private static final int CORTEX_POOL_SIZE = 4;
+    private static final long CORTEX_IDLE_TIMEOUT_MS = Duration.ofMinutes(30).toMillis();
+    private static final long CORTEX_MAX_LIFETIME_MS = Duration.ofHours(2).toMillis();
+
     private final SnowflakeProperties snowflakeProperties;
+    private final FindingRepo findingRepo;
     private final ObjectMapper objectMapper;
 
+    // Separate from the answer cache so cache hits never wait on a Snowflake login
+    private final Object dataSourceLock = new Object();
+    private volatile HikariDataSource dataSource;
+
+    // Only completed scans are asked about, and their findings never change.
+    private final Map<AnswerKey, String> answerCache = Collections.synchronizedMap(
+        new LinkedHashMap<>(64, 0.75f, true) {
+            @Override
+            protected boolean removeEldestEntry(Map.Entry<AnswerKey, String> eldest) {
+                return size() > ANSWER_CACHE_CAPACITY;
+            }
+        }
+    );
+
+    private record AnswerKey(UUID scanId, String question) {}
+
     /**
-     * Answer a natural-language question about a scan's findings using Cortex.
+     * Answer a natural-language question about a completed scan's findings using Cortex.
      */
-    public String askAboutFindings(List<Finding> findings, String question) {
+    public String askAboutScan(Scan scan, String question) {
         if (!snowflakeProperties.isConfigured()) {
             log.warn("Snowflake not configured — Cortex unavailable");
             return "Snowflake Cortex is not configured. Add SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, and SNOWFLAKE_PASSWORD to your .env to enable this feature.";
         }
 
-        String prompt = buildPrompt(findings, question);
+        AnswerKey key = new AnswerKey(scan.getId(), normalizeQuestion(question));
+        String cached = answerCache.get(key);
+        if (cached != null) return cached;
+
+        // Keep the prompt bounded: most severe, most confident findings first
+        List<FindingSummary> findings = findingRepo.findTopSummariesByScanId(
+            scan.getId(), PageRequest.of(0, snowflakeProperties.getChatPromptMaxFindings()));
+        String prompt = buildPrompt(findings, scan.getFindingsCount(), question);
 
         try (Connection conn = getConnection()) {
             String sql = "SELECT SNOWFLAKE.CORTEX.COMPLETE(?, ?) AS RESPONSE";
@@ -45,7 +84,10 @@ public class CortexService {
                 stmt.setString(2, prompt);
                 try (ResultSet rs = stmt.executeQuery()) {
                     if (rs.next()) {
-                        return parseResponse(rs.getString("RESPONSE"));
+                        String raw = rs.getString("RESPONSE");
+                        String answer = parseResponse(raw);
+                        if (raw != null) answerCache.put(key, answer);
+                        return answer;
                     }
                 }
             }
@@ -56,23 +98,33 @@ public class CortexService {
         return "No response from Cortex.";
     }
 
+    // -- Answer cache --------------------------------------------------------
+
+    private String normalizeQuestion(String question) {
+        return String.join(" ", question.toLowerCase().trim().split("\\s+"));
+    }
+
     // -- Helpers -------------------------------------------------------------
 
-    private String buildPrompt(List<Finding> findings, String question) {
+    private String buildPrompt(List<FindingSummary> findings, int totalFindings, String question) {
         StringBuilder sb = new StringBuilder();
         sb.append("You are a security consultant. The following vulnerabilities were found in a code scan.\n\n");
-        sb.append("FINDINGS (").append(findings.size()).append(" total):\n");
-
-        for (Finding f : findings) {
-            sb.append("- [").append(f.getSeverity()).append("] ")
-              .append(f.getVulnType()).append(" in ").append(f.getFilePath());
-            if (f.getLineNumber() != null) sb.append(":").append(f.getLineNumber());
-            sb.append("\n  ").append(f.getDescription());
-            if (f.getCommitAuthor() != null && !f.getCommitAuthor().isBlank()) {
-                sb.append("\n  Last modified by: ").append(f.getCommitAuthor());
+        sb.append("FINDINGS (").append(totalFindings).append(" total):\n");
+
+        for (FindingSummary f : findings) {
+            sb.append("- [").append(f.severity()).append("] ")
+              .append(f.vulnType()).append(" in ").append(f.filePath());
+            if (f.lineNumber() != null) sb.append(":").append(f.lineNumber());
+            sb.append("\n  ").append(f.description());
+            if (f.commitAuthor() != null && !f.commitAuthor().isBlank()) {
+                sb.append("\n  Last modified by: ").append(f.commitAuthor());
             }
             sb.append("\n");
         }
+        if (totalFindings > findings.size()) {
+            sb.append("... and ").append(totalFindings - findings.size())
+              .append(" more findings not listed.\n");
+        }
 
         sb.append("\nQUESTION: ").append(question)
           .append("\n\nProvide a clear, concise answer based on the findings above.");
@@ -91,14 +143,41 @@ public class CortexService {
         return raw;
     }
 
-    private Connection getConnection() throws Exception {
-        String url = "jdbc:snowflake://" + snowflakeProperties.getAccount() + ".snowflakecomputing.com/";
-        Properties props = new Properties();
-        props.put("user", snowflakeProperties.getUser());
-        props.put("password", snowflakeProperties.getPassword());
-        props.put("warehouse", snowflakeProperties.getWarehouse());
-        props.put("db", snowflakeProperties.getDatabase());
-        props.put("schema", snowflakeProperties.getSchema());
-        return DriverManager.getConnection(url, props);
+    private Connection getConnection() throws SQLException {
+        HikariDataSource ds = dataSource;
+        if (ds == null) {
+            synchronized (dataSourceLock) {
+                ds = dataSource;
+                if (ds == null) {
+                    ds = dataSource = createDataSource();
+                }
+            }
+        }
+        return ds.getConnection();
+    }
+
+    /** Small pool so each question reuses a Snowflake session instead of logging in again. */
+    private HikariDataSource createDataSource() {
+        HikariConfig config = new HikariConfig();
+        config.setPoolName("cortex");
+        config.setJdbcUrl("jdbc:snowflake://" + snowflakeProperties.getAccount() + ".snowflakecomputing.com/");
+        config.setUsername(snowflakeProperties.getUser());
+        config.setPassword(snowflakeProperties.getPassword());
+        config.addDataSourceProperty("warehouse", snowflakeProperties.getWarehouse());
+        config.addDataSourceProperty("db", snowflakeProperties.getDatabase());
+        config.addDataSourceProperty("schema", snowflakeProperties.getSchema());
+        config.setMaximumPoolSize(CORTEX_POOL_SIZE);
+        config.setMinimumIdle(0);
+        // Skip the fail-fast probe; the first question opens the first session
+        config.setInitializationFailTimeout(-1);
+        // Chat questions arrive minutes apart; keep sessions long enough to be reused
+        config.setIdleTimeout(CORTEX_IDLE_TIMEOUT_MS);
+        config.setMaxLifetime(CORTEX_MAX_LIFETIME_MS);
+        return new HikariDataSource(config);
+    }
+
+    @PreDestroy
+    void closeDataSource() {
+        if (dataSource != null) dataSource.close();
     }
 }
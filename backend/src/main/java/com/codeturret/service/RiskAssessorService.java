@@ -6,6 +6,8 @@ import org.springframework.stereotype.Service;
 
 import java.util.*;
 import java.util.regex.Pattern;
+import java.util.stream.Collectors;
+import java.util.stream.Stream;
 
 /**
  * Scores and prioritizes files for scanning.
@@ -30,18 +32,10 @@ public class RiskAssessorService {
         "secrets.json", "credentials.json"
     );
 
-    private static final List<Pattern> HIGH_RISK_PATH_PATTERNS = List.of(
-        Pattern.compile("\\.github/workflows/"),
-        Pattern.compile("(^|/)auth"),
-        Pattern.compile("(^|/)login"),
-        Pattern.compile("(^|/)middleware"),
-        Pattern.compile("(^|/)api/"),
-        Pattern.compile("(^|/)routes?/"),
-        Pattern.compile("(^|/)controllers?/"),
-        Pattern.compile("(^|/)handlers?/"),
-        Pattern.compile("(^|/)db/"),
-        Pattern.compile("(^|/)models?/"),
-        Pattern.compile("(^|/)config")
+    private static final Pattern HIGH_RISK_PATH_PATTERN = Pattern.compile(
+        "\\.github/workflows/"
+        + "|(^|/)(auth|login|middleware|config)"
+        + "|(^|/)(api|routes?|controllers?|handlers?|db|models?)/"
     );
 
     private static final Set<String> RISK_KEYWORDS = Set.of(
@@ -60,13 +54,8 @@ public class RiskAssessorService {
         "contributing.md", ".prettierrc", ".eslintrc"
     );
 
-    private static final List<Pattern> SKIP_PATH_PATTERNS = List.of(
-        Pattern.compile("(^|/)node_modules/"),
-        Pattern.compile("(^|/)\\.git/"),
-        Pattern.compile("(^|/)dist/"),
-        Pattern.compile("(^|/)build/"),
-        Pattern.compile("(^|/)__pycache__/"),
-        Pattern.compile("(^|/)vendor/")
+    private static final Pattern SKIP_PATH_PATTERN = Pattern.compile(
+        "(^|/)(node_modules|\\.git|dist|build|__pycache__|vendor)/"
     );
 
     private static final Set<String> SKIP_EXTENSIONS = Set.of(
@@ -76,6 +65,8 @@ public class RiskAssessorService {
 
     private static final List<String> SKIP_SUFFIXES = List.of(".d.ts", ".min.js", ".min.css");
 
+    private static final int PARALLEL_SCORING_THRESHOLD = 64;
+
     private final GitProperties gitProperties;
 
     public record ScoredFile(String relativePath, java.nio.file.Path fullPath, int riskScore) {}
@@ -89,29 +80,57 @@ public class RiskAssessorService {
         Map<String, Integer> hotFiles,
         Map<String, List<String>> securityFiles
     ) {
-        List<ScoredFile> scored = new ArrayList<>();
-
-        for (GitService.FileEntry f : files) {
-            String content = contents.getOrDefault(f.relativePath(), "");
-            int risk = assessRisk(f.relativePath(), content);
-            if (risk == RISK_SKIP) continue;
-
-            // Apply git signals
-            if (hotFiles.getOrDefault(f.relativePath(), 0) >= GIT_HOT_FILE_THRESHOLD) {
-                risk += GIT_HOT_FILE_BONUS;
-            }
-            if (securityFiles.containsKey(f.relativePath())) {
-                risk += GIT_SECURITY_COMMIT_BONUS;
-            }
-            scored.add(new ScoredFile(f.relativePath(), f.fullPath(), risk));
-        }
+        // Content keyword scans dominate on large repos; spread them across cores
+        Stream<GitService.FileEntry> stream = files.size() > PARALLEL_SCORING_THRESHOLD
+            ? files.parallelStream()
+            : files.stream();
+
+        List<ScoredFile> scored = stream
+            .map(f -> scoreFile(f, contents, hotFiles, securityFiles))
+            .filter(Objects::nonNull)
+            .collect(Collectors.toCollection(ArrayList::new));
 
         scored.sort(Comparator.comparingInt(ScoredFile::riskScore).reversed());
         int cap = gitProperties.getMaxScanFiles();
         return scored.size() > cap ? scored.subList(0, cap) : scored;
     }
 
+    /** Score one file with git signals applied, or null if it should be skipped. */
+    private ScoredFile scoreFile(
+        GitService.FileEntry f,
+        Map<String, String> contents,
+        Map<String, Integer> hotFiles,
+        Map<String, List<String>> securityFiles
+    ) {
+        String content = contents.getOrDefault(f.relativePath(), "");
+        int risk = assessRisk(f.relativePath(), content);
+        if (risk == RISK_SKIP) return null;
+
+        // Apply git signals
+        if (hotFiles.getOrDefault(f.relativePath(), 0) >= GIT_HOT_FILE_THRESHOLD) {
+            risk += GIT_HOT_FILE_BONUS;
+        }
+        if (securityFiles.containsKey(f.relativePath())) {
+            risk += GIT_SECURITY_COMMIT_BONUS;
+        }
+        return new ScoredFile(f.relativePath(), f.fullPath(), risk);
+    }
+
     public int assessRisk(String filePath, String content) {
+        int score = assessPathRisk(filePath);
+        if (score == RISK_SKIP || score == RISK_HIGH) return score;
+
+        if (!content.isEmpty()) {
+            int matches = countRiskKeywords(content.toLowerCase());
+            if (matches >= 3) score = Math.max(score, RISK_HIGH);
+            else if (matches >= 1) score = Math.max(score, RISK_MEDIUM);
+        }
+
+        return score;
+    }
+
+    /** Path-only part of the score; content can only raise it, never skip it. */
+    private int assessPathRisk(String filePath) {
         String lower = filePath.toLowerCase();
         String basename = getBasename(lower);
         String ext = getExtension(basename);
@@ -121,29 +140,21 @@ public class RiskAssessorService {
         for (String suffix : SKIP_SUFFIXES) {
             if (lower.endsWith(suffix)) return RISK_SKIP;
         }
-        for (Pattern p : SKIP_PATH_PATTERNS) {
-            if (p.matcher(lower).find()) return RISK_SKIP;
-        }
-
-        int score = RISK_LOW;
+        if (SKIP_PATH_PATTERN.matcher(lower).find()) return RISK_SKIP;
 
         if (HIGH_RISK_NAMES.contains(basename)) return RISK_HIGH;
+        if (HIGH_RISK_PATH_PATTERN.matcher(lower).find()) return RISK_HIGH;
 
-        for (Pattern p : HIGH_RISK_PATH_PATTERNS) {
-            if (p.matcher(lower).find()) {
-                score = Math.max(score, RISK_HIGH);
-                break;
-            }
-        }
+        return RISK_LOW;
+    }
 
-        if (!content.isEmpty()) {
-            String lowerContent = content.toLowerCase();
-            int matches = (int) RISK_KEYWORDS.stream().filter(lowerContent::contains).count();
-            if (matches >= 3) score = Math.max(score, RISK_HIGH);
-            else if (matches >= 1) score = Math.max(score, RISK_MEDIUM);
+    /** Distinct risk keywords in content, capped at 3 since no threshold goes higher. */
+    private int countRiskKeywords(String lowerContent) {
+        int matches = 0;
+        for (String keyword : RISK_KEYWORDS) {
+            if (lowerContent.contains(keyword) && ++matches >= 3) break;
         }
-
-        return score;
+        return matches;
     }
 
     private String getBasename(String path) {
@@ -18,12 +18,16 @@ import org.springframework.transaction.annotation.Transactional;
 import java.nio.file.Path;
 import java.time.Instant;
 import java.util.*;
+import java.util.stream.Collectors;
 
 @Component
 @RequiredArgsConstructor
 @Slf4j
 public class ScanWorker {
 
+    private static final Map<String, Severity> SEVERITY_BY_NAME = Arrays.stream(Severity.values())
+        .collect(Collectors.toUnmodifiableMap(Severity::name, s -> s));
+
     private final ScanRepo scanRepo;
     private final RepositoryRepo repositoryRepo;
     private final FindingRepo findingRepo;
@@ -180,6 +184,7 @@ public class ScanWorker {
     }
 
     private Severity parseSeverity(String s) {
-        try { return Severity.valueOf(s.toUpperCase()); } catch (Exception e) { return Severity.MEDIUM; }
+        if (s == null) return Severity.MEDIUM;
+        return SEVERITY_BY_NAME.getOrDefault(s.toUpperCase(), Severity.MEDIUM);
     }
 }
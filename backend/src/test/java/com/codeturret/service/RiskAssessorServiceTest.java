@@ -0,0 +1,85 @@
+package com.codeturret.service;
+
+import com.codeturret.config.GitProperties;
+import org.junit.jupiter.api.Test;
+
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+class RiskAssessorServiceTest {
+
+    private static final int RISK_LOW    = 1;
+    private static final int RISK_MEDIUM = 2;
+    private static final int RISK_HIGH   = 3;
+
+    private final RiskAssessorService riskAssessor = new RiskAssessorService(new GitProperties());
+
+    @Test
+    void contentWithoutKeywordsStaysLow() {
+        assertThat(riskAssessor.assessRisk("src/app.py", "print('hello')")).isEqualTo(RISK_LOW);
+    }
+
+    @Test
+    void contentWithOneKeywordIsMedium() {
+        assertThat(riskAssessor.assessRisk("src/app.py", "x = eval(data)")).isEqualTo(RISK_MEDIUM);
+    }
+
+    @Test
+    void contentWithTwoKeywordsIsMedium() {
+        assertThat(riskAssessor.assessRisk("src/app.py", "password = get_token()")).isEqualTo(RISK_MEDIUM);
+    }
+
+    @Test
+    void contentWithThreeKeywordsIsHigh() {
+        String content = "password = os.environ['SECRET']\ncursor.execute('SELECT * FROM users')";
+        assertThat(riskAssessor.assessRisk("src/app.py", content)).isEqualTo(RISK_HIGH);
+    }
+
+    @Test
+    void keywordMatchingIsCaseInsensitive() {
+        assertThat(riskAssessor.assessRisk("src/app.py", "PASSWORD")).isEqualTo(RISK_MEDIUM);
+    }
+
+    @Test
+    void overlappingKeywordsAreCountedSeparately() {
+        // dangerouslysetinnerhtml contains innerhtml: two keywords, one more makes three
+        assertThat(riskAssessor.assessRisk("src/App.jsx", "<div dangerouslySetInnerHTML={html} />"))
+            .isEqualTo(RISK_MEDIUM);
+        assertThat(riskAssessor.assessRisk("src/App.jsx", "<div dangerouslySetInnerHTML={html} /> {token}"))
+            .isEqualTo(RISK_HIGH);
+    }
+
+    @Test
+    void prioritizeLargeRepoMatchesSerialOrdering() {
+        GitProperties props = new GitProperties();
+        props.setMaxScanFiles(1000);
+        RiskAssessorService assessor = new RiskAssessorService(props);
+
+        // Above the parallel threshold: skipped, high-risk and plain files interleaved
+        List<GitService.FileEntry> files = new ArrayList<>();
+        List<String> expectedHigh = new ArrayList<>();
+        List<String> expectedLow = new ArrayList<>();
+        for (int i = 0; i < 300; i++) {
+            String path = switch (i % 3) {
+                case 0 -> "node_modules/pkg" + i + "/index.js";
+                case 1 -> "src/auth/handler" + i + ".py";
+                default -> "src/lib/module" + i + ".py";
+            };
+            files.add(new GitService.FileEntry(path, Path.of(path)));
+            if (i % 3 == 1) expectedHigh.add(path);
+            if (i % 3 == 2) expectedLow.add(path);
+        }
+
+        List<String> ranked = assessor.prioritize(files, Map.of(), Map.of(), Map.of()).stream()
+            .map(RiskAssessorService.ScoredFile::relativePath)
+            .toList();
+
+        List<String> expected = new ArrayList<>(expectedHigh);
+        expected.addAll(expectedLow);
+        assertThat(ranked).isEqualTo(expected);
+    }
+}